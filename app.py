@@ -2,17 +2,35 @@ import aiosqlite
 import csv
 import os
 import re
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
-from typing import List, Dict, Optional
-from datetime import datetime
-from difflib import SequenceMatcher
+import time
+from typing import List, Dict, Mapping, Optional
+from datetime import date
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from rapidfuzz import fuzz, process
+import gzip
+import hashlib
 import json
+import logging
 
-app = FastAPI()
+# Per-request traces are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("civic_ai")
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+if isinstance(logging.getLevelName(log_level), int):
+    logger.setLevel(log_level)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", log_level)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -26,103 +44,127 @@ app.add_middleware(
 # Define the path to your database file
 DATABASE_URL = "officials.db"
 
+# "district 7" style references (compiled once, matches any casing)
+DISTRICT_PATTERN = re.compile(r'district\s+(\d+)', re.IGNORECASE)
+
+# "council district 7" references, which neighborhood mentions are rewritten to
+COUNCIL_DISTRICT_PATTERN = re.compile(r'council\s+district\s+(\d+)', re.IGNORECASE)
+
+# Title Case full names ("Michelle Wu", "Tania Fernandes Anderson")
+NAME_PATTERN = re.compile(r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b')
+
+# Pronouns resolved against the conversation history
+FEMALE_PRONOUN_PATTERN = re.compile(r'\b(?:she|her|hers)\b', re.IGNORECASE)
+MALE_PRONOUN_PATTERN = re.compile(r'\b(?:he|him|his)\b', re.IGNORECASE)
+GOVERNOR_PATTERN = re.compile(r'\bgovernor\b', re.IGNORECASE)
+FEMALE_OFFICIALS = frozenset({"Michelle Wu", "Elizabeth Warren", "Ayanna Pressley", "Maura Healey", "Andrea Campbell", "Kim Driscoll"})
+MALE_OFFICIALS = frozenset({"Ed Markey", "Stephen Lynch", "Ed Flynn", "Nick Collins"})
+
+# In-memory snapshot of the officials table, loaded on startup and used for
+# every search (the database only persists the data between deploys)
+officials_data: List[Dict] = []
+officials_by_district: Dict[int, List[Dict]] = {}
+officials_by_office: Dict[str, List[Dict]] = {}
+officials_by_party: Dict[str, List[Dict]] = {}
+
+# LRU search result cache: (search term, target info) -> officials
+# (the snapshot is static; load_officials clears it on reload)
+SEARCH_CACHE_SIZE = 512
+search_cache = OrderedDict()
+
 # Pydantic Model for API Requests
 class QueryRequest(BaseModel):
     query: str
     session_id: str = "default"
 
 # CUSTOM CONVERSATION ENGINE
+# Keywords reported as entities by extract_entities when they appear in a query
+ENTITY_OFFICE_KEYWORDS = ("mayor", "governor", "senator", "representative", "councilor", "attorney general")
+ENTITY_PARTY_KEYWORDS = ("democrat", "republican", "nonpartisan", "independent")
+ENTITY_CONCEPT_KEYWORDS = ("salary", "election", "term", "office", "contact", "phone", "email")
+
+# Most sessions kept in memory; the least recently used one is dropped past this
+MAX_SESSIONS = 10_000
+
 class ConversationContext:
     """Intelligent conversation context manager."""
     
     def __init__(self):
-        self.sessions = {}  # session_id -> conversation state
+        self.sessions = OrderedDict()  # session_id -> conversation state, least recently used first
     
     def get_session(self, session_id: str = "default") -> dict:
-        """Get or create conversation session."""
-        if session_id not in self.sessions:
-            self.sessions[session_id] = {
-                "history": [],  # List of {query, response, entities, timestamp}
-                "current_entities": {},  # Currently active entities
-                "context_stack": [],  # Stack of conversation topics
-                "user_patterns": {}  # Learned user behavior patterns
-            }
-        return self.sessions[session_id]
-    
-    def extract_entities(self, text: str) -> dict:
-        """Extract people, offices, and other entities from text."""
-        entities = {
-            "people": [],
-            "offices": [],
-            "districts": [],
-            "parties": [],
-            "concepts": []
+        """Get or create conversation session (evicting the least recently used past MAX_SESSIONS)."""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+        session = self.sessions[session_id] = {
+            "history": deque(maxlen=20),  # {query, response, people, timestamp (ns)}, oldest evicted
+            "context_stack": [],  # Stack of conversation topics
+            "user_patterns": {}  # Learned user behavior patterns
         }
-        
+        if len(self.sessions) > MAX_SESSIONS:
+            self.sessions.popitem(last=False)
+        return session
+    
+    # Cached results are shared between callers, so cached methods return read-only values
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def extract_entities(text: str) -> Mapping:
+        """Extract people, offices, and other entities from text."""
         text_lower = text.lower()
         
-        # Extract names (pattern: Title Case Name)
-        name_pattern = r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b'
-        names = re.findall(name_pattern, text)
-        entities["people"] = names
-        
-        # Extract offices
-        office_keywords = ["mayor", "governor", "senator", "representative", "councilor", "attorney general"]
-        for office in office_keywords:
-            if office in text_lower:
-                entities["offices"].append(office)
-        
-        # Extract districts
-        district_matches = re.findall(r'district\s+(\d+)', text_lower)
-        entities["districts"] = district_matches
-        
-        # Extract parties
-        party_keywords = ["democrat", "republican", "nonpartisan", "independent"]
-        for party in party_keywords:
-            if party in text_lower:
-                entities["parties"].append(party)
-        
-        # Extract concepts
-        concept_keywords = ["salary", "election", "term", "office", "contact", "phone", "email"]
-        for concept in concept_keywords:
-            if concept in text_lower:
-                entities["concepts"].append(concept)
-        
-        return entities
+        return MappingProxyType({
+            # Extract names (pattern: Title Case Name)
+            "people": tuple(NAME_PATTERN.findall(text)),
+            # Extract offices
+            "offices": tuple(office for office in ENTITY_OFFICE_KEYWORDS if office in text_lower),
+            # Extract districts
+            "districts": tuple(DISTRICT_PATTERN.findall(text_lower)),
+            # Extract parties
+            "parties": tuple(party for party in ENTITY_PARTY_KEYWORDS if party in text_lower),
+            # Extract concepts
+            "concepts": tuple(concept for concept in ENTITY_CONCEPT_KEYWORDS if concept in text_lower)
+        })
+    
+    @staticmethod
+    def recent_exchanges(session: dict, count: int) -> list:
+        """Return the last `count` exchanges of a session, oldest first."""
+        history = session["history"]
+        return list(islice(history, max(0, len(history) - count), None))
+    
+    @staticmethod
+    def exchange_people(exchange: dict) -> list:
+        """Return the people named in an exchange, extracting them the first time they are needed."""
+        if exchange["people"] is None:
+            exchange["people"] = NAME_PATTERN.findall(f"{exchange['query']} {exchange['response']}")
+        return exchange["people"]
+    
+    def most_recent_person(self, session: dict, count: int, candidates=None) -> Optional[str]:
+        """Return the last person mentioned in the last `count` exchanges (optionally only from `candidates`)."""
+        for exchange in reversed(self.recent_exchanges(session, count)):
+            for name in reversed(self.exchange_people(exchange)):
+                if candidates is None or name in candidates:
+                    return name
+        return None
     
     def resolve_pronouns(self, query: str, session: dict) -> str:
         """Intelligently resolve pronouns based on conversation context."""
         query_lower = query.lower()
         
-        # Get recent entities from conversation history
-        recent_people = []
-        for exchange in session["history"][-3:]:  # Last 3 exchanges
-            recent_people.extend(exchange.get("entities", {}).get("people", []))
-        
-        # Resolve "she/her"
+        # Resolve "she/her" to the most recent woman in the last 3 exchanges
         if any(pronoun in query_lower for pronoun in ["she", "her", "hers"]):
-            female_officials = ["Michelle Wu", "Elizabeth Warren", "Ayanna Pressley", "Maura Healey", "Andrea Campbell", "Kim Driscoll"]
-            recent_females = [name for name in recent_people if name in female_officials]
-            
-            if recent_females:
-                target_name = recent_females[-1]  # Most recent
-            else:
+            target_name = self.most_recent_person(session, 3, FEMALE_OFFICIALS)
+            if target_name is None:
                 target_name = "Michelle Wu"  # Default to most prominent
             
-            query = re.sub(r'\bshe\b', target_name, query, flags=re.IGNORECASE)
-            query = re.sub(r'\bher\b', target_name, query, flags=re.IGNORECASE)
-            query = re.sub(r'\bhers\b', target_name, query, flags=re.IGNORECASE)
+            query = FEMALE_PRONOUN_PATTERN.sub(target_name, query)
         
-        # Resolve "he/him"
+        # Resolve "he/him" to the most recent man in the last 3 exchanges
         if any(pronoun in query_lower for pronoun in ["he", "him", "his"]):
-            male_officials = ["Ed Markey", "Stephen Lynch", "Ed Flynn", "Nick Collins"]
-            recent_males = [name for name in recent_people if name in male_officials]
-            
-            if recent_males:
-                target_name = recent_males[-1]  # Most recent
-                query = re.sub(r'\bhe\b', target_name, query, flags=re.IGNORECASE)
-                query = re.sub(r'\bhim\b', target_name, query, flags=re.IGNORECASE)
-                query = re.sub(r'\bhis\b', target_name, query, flags=re.IGNORECASE)
+            target_name = self.most_recent_person(session, 3, MALE_OFFICIALS)
+            if target_name is not None:
+                query = MALE_PRONOUN_PATTERN.sub(target_name, query)
         
         return query
     
@@ -137,21 +179,17 @@ class ConversationContext:
         
         # If asking about salary/money without a name, use recent person
         if any(word in query_lower for word in ["salary", "pay", "money", "earn", "make", "income"]) and not any(word in query_lower for word in ["who", "what", "michelle", "elizabeth"]):
-            recent_people = []
-            for exchange in session["history"][-2:]:
-                recent_people.extend(exchange.get("entities", {}).get("people", []))
-            if recent_people:
-                enhanced_query = f"{recent_people[-1]} {enhanced_query}"
+            recent_person = self.most_recent_person(session, 2)
+            if recent_person:
+                enhanced_query = f"{recent_person} {enhanced_query}"
         
         # If asking about time/term without a name, use recent person and prioritize governor
         if any(phrase in query_lower for phrase in ["how long", "when did", "since when", "term", "been in office", "how long has"]) and not any(word in query_lower for word in ["who", "what", "michelle", "elizabeth"]):
-            recent_people = []
-            for exchange in session["history"][-2:]:
-                recent_people.extend(exchange.get("entities", {}).get("people", []))
-            if recent_people:
-                enhanced_query = f"{recent_people[-1]} {enhanced_query}"
+            recent_person = self.most_recent_person(session, 2)
+            if recent_person:
+                enhanced_query = f"{recent_person} {enhanced_query}"
             elif "governor" in query_lower:
-                enhanced_query = re.sub(r'\bgovernor\b', "Maura Healey", enhanced_query, flags=re.IGNORECASE)
+                enhanced_query = GOVERNOR_PATTERN.sub("Maura Healey", enhanced_query)
         
         return enhanced_query
     
@@ -159,27 +197,45 @@ class ConversationContext:
         """Add a conversation exchange to history."""
         session = self.get_session(session_id)
         
-        entities = self.extract_entities(f"{query} {response}")
-        
         exchange = {
             "query": query,
             "response": response,
-            "entities": entities,
-            "timestamp": datetime.now().isoformat()
+            "people": None,  # extracted on first use by exchange_people
+            "timestamp": time.time_ns()
         }
         
         session["history"].append(exchange)
-        
-        # Update current entities (keep last 3 exchanges worth)
-        session["current_entities"] = entities
-        
-        # Limit history size
-        if len(session["history"]) > 20:
-            session["history"] = session["history"][-20:]
 
 # Global conversation engine
 conversation_engine = ConversationContext()
 
+def parse_int(value: Optional[str]) -> Optional[int]:
+    """Convert a CSV cell to int (empty or invalid values become None)."""
+    if value and value.strip():
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+def csv_row_to_record(row: dict) -> tuple:
+    """Convert a CSV row into a tuple matching the officials INSERT column order."""
+    return (
+        row['name'], row['office'], row.get('district_type', ''), 
+        row.get('district_number', ''), row.get('district_area', ''), 
+        row.get('email', ''), row.get('phone', ''), 
+        row.get('website', ''), row.get('x_account', ''), 
+        row.get('facebook_page', ''), row.get('level', ''),
+        row.get('party', ''), row.get('term_start_date', ''), 
+        row.get('next_election_date', ''), parse_int(row.get('annual_salary')),
+        row.get('bio_summary', ''), row.get('education', ''), 
+        row.get('career_before_office', ''), row.get('key_policy_areas', ''),
+        row.get('committee_memberships', ''), row.get('recent_major_vote', ''),
+        row.get('recent_initiative', ''), row.get('campaign_promises', ''),
+        parse_int(row.get('responsiveness_score')), row.get('town_halls_per_year', ''), 
+        row.get('office_hours', '')
+    )
+
 # Database initialization with ENHANCED SCHEMA
 async def init_database():
     """Initialize the database and populate it with data from CSV if it doesn't exist."""
@@ -227,124 +283,125 @@ async def init_database():
                 # Populate from CSV file with NEW enhanced columns
                 if os.path.exists('officials.csv'):
                     with open('officials.csv', 'r', newline='', encoding='utf-8') as csvfile:
-                        reader = csv.DictReader(csvfile)
-                        for row in reader:
-                            # Handle responsiveness_score conversion (empty string to None)
-                            responsiveness_score = None
-                            if row.get('responsiveness_score') and row['responsiveness_score'].strip():
-                                try:
-                                    responsiveness_score = int(row['responsiveness_score'])
-                                except ValueError:
-                                    responsiveness_score = None
-
-                            # Handle annual_salary conversion
-                            annual_salary = None
-                            if row.get('annual_salary') and row['annual_salary'].strip():
-                                try:
-                                    annual_salary = int(row['annual_salary'])
-                                except ValueError:
-                                    annual_salary = None
-
-                            await db.execute('''
-                                INSERT INTO officials (
-                                    name, office, district_type, district_number, district_area, 
-                                    email, phone, website, x_account, facebook_page, level, party, 
-                                    term_start_date, next_election_date, annual_salary,
-                                    bio_summary, education, career_before_office, key_policy_areas,
-                                    committee_memberships, recent_major_vote, recent_initiative,
-                                    campaign_promises, responsiveness_score, town_halls_per_year, office_hours
-                                )
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            ''', (
-                                row['name'], row['office'], row.get('district_type', ''), 
-                                row.get('district_number', ''), row.get('district_area', ''), 
-                                row.get('email', ''), row.get('phone', ''), 
-                                row.get('website', ''), row.get('x_account', ''), 
-                                row.get('facebook_page', ''), row.get('level', ''),
-                                row.get('party', ''), row.get('term_start_date', ''), 
-                                row.get('next_election_date', ''), annual_salary,
-                                row.get('bio_summary', ''), row.get('education', ''), 
-                                row.get('career_before_office', ''), row.get('key_policy_areas', ''),
-                                row.get('committee_memberships', ''), row.get('recent_major_vote', ''),
-                                row.get('recent_initiative', ''), row.get('campaign_promises', ''),
-                                responsiveness_score, row.get('town_halls_per_year', ''), 
-                                row.get('office_hours', '')
-                            ))
+                        records = [csv_row_to_record(row) for row in csv.DictReader(csvfile)]
+
+                    # Insert every row in one batch (single transaction, single commit)
+                    await db.executemany('''
+                        INSERT INTO officials (
+                            name, office, district_type, district_number, district_area, 
+                            email, phone, website, x_account, facebook_page, level, party, 
+                            term_start_date, next_election_date, annual_salary,
+                            bio_summary, education, career_before_office, key_policy_areas,
+                            committee_memberships, recent_major_vote, recent_initiative,
+                            campaign_promises, responsiveness_score, town_halls_per_year, office_hours
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', records)
                     await db.commit()
-                    print("Database populated with enhanced officials data")
+                    logger.info("Database populated with enhanced officials data")
                 else:
-                    print("Warning: officials.csv not found")
-    except Exception as e:
-        print(f"Error initializing database: {str(e)}")
+                    logger.warning("officials.csv not found")
+    except Exception:
+        logger.exception("Error initializing database")
         raise
 
 # SEARCH TERM EXTRACTION
+# Lowercase names in different question formats, tried in order
+# ("did" also covers "where did" and "what did")
+QUESTION_NAME_PATTERNS = [
+    (re.compile(r'\bdid\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+'), 'did pattern'),
+    (re.compile(r'\bwhat does\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+'), 'what does pattern'),
+    (re.compile(r'\b([a-z]+ [a-z]+)(?:\'s|s)\b'), 'possessive pattern')
+]
+
+# Common question words and phrases stripped before a general search
+QUESTION_WORDS_PATTERN = re.compile(r'\b(who is|what is|tell me about|show me|find|search for|about|the|of|boston|educational|background|policy|focus|career|did|does|where|what|has|been|in|office)\b')
+
+# Office words searched for directly when a query mentions them (checked in order)
+SEARCH_OFFICE_TERMS = {
+    'mayor': 'mayor',
+    'governor': 'governor',
+    'senator': 'senator',
+    'representative': 'representative',
+    'councilor': 'councilor',
+    'councillor': 'councilor'
+}
+
+@lru_cache(maxsize=2048)
 def extract_search_terms(query: str) -> str:
     """Extract the actual search terms from natural language queries."""
     query_lower = query.lower().strip()
     original_query = query.strip()
     
-    print(f"DEBUG: Processing query: '{query}' -> '{query_lower}'")
+    logger.debug("Processing query: '%s' -> '%s'", query, query_lower)
     
-    # PRIORITY: Handle office queries FIRST
-    offices = {
-        'mayor': 'mayor',
-        'governor': 'governor',
-        'senator': 'senator',
-        'representative': 'representative',
-        'councilor': 'councilor',
-        'councillor': 'councilor'
-    }
+    # Neighborhoods rewritten to a council district (only done when no other office is named)
+    council_match = COUNCIL_DISTRICT_PATTERN.search(query_lower)
+    if council_match:
+        result = f"council district {council_match.group(1)}"
+        logger.debug("Found council district: %s", result)
+        return result
     
-    for key, value in offices.items():
+    # PRIORITY: Handle office queries FIRST
+    for key, value in SEARCH_OFFICE_TERMS.items():
         if key in query_lower:
-            print(f"DEBUG: Found '{key}' in query")
+            logger.debug("Found '%s' in query", key)
             return value
     
     # First, try to extract names from the ORIGINAL query (preserves capitalization)
-    name_pattern = r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b'
-    names = re.findall(name_pattern, original_query)
+    names = NAME_PATTERN.findall(original_query)
     if names:
-        print(f"DEBUG: Found name: {names[0]}")
+        logger.debug("Found name: %s", names[0])
         return names[0]
     
     # Look for names in different question formats
-    patterns = [
-        (r'\bdid\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+', 'did pattern'),
-        (r'\bwhere did\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+', 'where did pattern'),
-        (r'\bwhat did\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+', 'what did pattern'),
-        (r'\bwhat does\s+([a-z]+ [a-z]+(?:\s[a-z]+)*)\s+', 'what does pattern'),
-        (r'\b([a-z]+ [a-z]+)(?:\'s|s)\b', 'possessive pattern')
-    ]
-    
-    for pattern, pattern_name in patterns:
-        match = re.search(pattern, query_lower)
+    for pattern, pattern_name in QUESTION_NAME_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             result = ' '.join(word.capitalize() for word in match.group(1).split())
-            print(f"DEBUG: Found name in '{pattern_name}': {result}")
+            logger.debug("Found name in '%s': %s", pattern_name, result)
             return result
     
     # Extract districts
-    district_match = re.search(r'district\s+(\d+)', query_lower)
+    district_match = DISTRICT_PATTERN.search(query_lower)
     if district_match:
         result = f"district {district_match.group(1)}"
-        print(f"DEBUG: Found district: {result}")
+        logger.debug("Found district: %s", result)
         return result
     
     # Remove common question words and phrases for general search
-    query_cleaned = re.sub(r'\b(who is|what is|tell me about|show me|find|search for|about|the|of|boston|educational|background|policy|focus|career|did|does|where|what|has|been|in|office)\b', '', query_lower).strip()
+    query_cleaned = QUESTION_WORDS_PATTERN.sub('', query_lower).strip()
     
     # Final fallback - return cleaned query or original
     result = query_cleaned if query_cleaned else query
-    print(f"DEBUG: Final fallback result: '{result}'")
+    logger.debug("Final fallback result: '%s'", result)
     return result
 
 # SEMANTIC QUERY UNDERSTANDING
+# Phrases that ask for a detailed profile or a basic identification
+DETAIL_PHRASES = ('what is', 'tell me about', 'about', 'details')
+BASIC_PHRASES = ('who is', 'who')
+
+# Information a query asks for, keyed by target, with the phrases that signal it (checked in order)
+INTENT_TARGET_KEYWORDS = {
+    'salary': ['salary', 'pay', 'money', 'earn', 'make', 'income'],
+    'time_in_office': ['how long', 'when did', 'since when', 'term', 'been in office', 'how long has'],
+    'contact': ['contact', 'email', 'phone', 'reach'],
+    'party': ['party', 'democrat', 'republican', 'affiliation'],
+    'education': ['education', 'educational', 'school', 'college', 'university', 'degree', 'studied', 'graduate', 'graduated', 'attend', 'attended', 'alma mater'],
+    'career': ['career', 'background', 'before office', 'work', 'job', 'experience', 'worked', 'did before', 'previous job', 'used to do', 'profession', 'occupation'],
+    'policy': ['policy', 'policies', 'focus', 'focuses', 'issues', 'priorities', 'works on', 'champions', 'believe', 'believes', 'stands for', 'fights for', 'supports', 'cares about', 'passionate about', 'agenda', 'platform', 'positions', 'views', 'stance', 'advocates', 'committed to']
+}
+
+# Offices recorded as search entities when mentioned
+INTENT_OFFICE_KEYWORDS = ("mayor", "governor", "senator", "representative", "councilor")
+
 class QueryAnalyzer:
     """Understands the intent and semantic meaning of queries."""
     
     @staticmethod
-    def analyze_query_intent(query: str) -> dict:
+    @lru_cache(maxsize=2048)
+    def analyze_query_intent(query: str) -> Mapping:
         """Analyze query intent and extract semantic information."""
         query_lower = query.lower().strip()
         
@@ -357,46 +414,29 @@ class QueryAnalyzer:
         }
         
         # Determine detail level
-        detail_phrases = ['what is', 'tell me about', 'about', 'details']
-        basic_phrases = ['who is', 'who']
-        
-        if any(phrase in query_lower for phrase in detail_phrases):
+        if any(phrase in query_lower for phrase in DETAIL_PHRASES):
             intent_analysis["detail_level"] = "detailed"
-        elif any(phrase in query_lower for phrase in basic_phrases):
+        elif any(phrase in query_lower for phrase in BASIC_PHRASES):
             intent_analysis["detail_level"] = "basic"
         
         # Determine target information
-        target_mappings = {
-            'salary': ['salary', 'pay', 'money', 'earn', 'make', 'income'],
-            'time_in_office': ['how long', 'when did', 'since when', 'term', 'been in office', 'how long has'],
-            'contact': ['contact', 'email', 'phone', 'reach'],
-            'party': ['party', 'democrat', 'republican', 'affiliation'],
-            'education': ['education', 'educational', 'school', 'college', 'university', 'degree', 'studied', 'graduate', 'graduated', 'attend', 'attended', 'alma mater'],
-            'career': ['career', 'background', 'before office', 'work', 'job', 'experience', 'worked', 'did before', 'previous job', 'used to do', 'profession', 'occupation'],
-            'policy': ['policy', 'policies', 'focus', 'focuses', 'issues', 'priorities', 'works on', 'champions', 'believe', 'believes', 'stands for', 'fights for', 'supports', 'cares about', 'passionate about', 'agenda', 'platform', 'positions', 'views', 'stance', 'advocates', 'committed to']
-        }
-        
-        for target, keywords in target_mappings.items():
+        for target, keywords in INTENT_TARGET_KEYWORDS.items():
             if any(keyword in query_lower for keyword in keywords):
                 intent_analysis["target_info"].append(target)
         
         # Extract search entities
-        name_pattern = r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b'
-        intent_analysis["search_entities"].extend(re.findall(name_pattern, query))
+        intent_analysis["search_entities"].extend(NAME_PATTERN.findall(query))
         
-        offices = ["mayor", "governor", "senator", "representative", "councilor"]
-        intent_analysis["search_entities"].extend([office for office in offices if office in query_lower])
+        intent_analysis["search_entities"].extend([office for office in INTENT_OFFICE_KEYWORDS if office in query_lower])
         
-        district_matches = re.findall(r'district\s+(\d+)', query_lower)
+        district_matches = DISTRICT_PATTERN.findall(query_lower)
         intent_analysis["search_entities"].extend([f"district {district}" for district in district_matches])
         
-        return intent_analysis
+        intent_analysis["target_info"] = tuple(intent_analysis["target_info"])
+        intent_analysis["search_entities"] = tuple(intent_analysis["search_entities"])
+        return MappingProxyType(intent_analysis)
 
 # FUZZY MATCHING AND VARIATIONS
-def fuzzy_match(text1: str, text2: str, threshold: float = 0.6) -> bool:
-    """Check if two strings are similar enough (handles typos)."""
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio() >= threshold
-
 NEIGHBORHOOD_VARIATIONS = {
     'roslindale': ['roslindale', 'roslindal', 'roslindail'],
     'jamaica plain': ['jamaica plain', 'jamaca plain', 'jamaicaplain', 'jp'],
@@ -414,6 +454,26 @@ NEIGHBORHOOD_VARIATIONS = {
     'mission hill': ['mission hill', 'missionhill', 'mission-hill']
 }
 
+# Boston City Council district for each neighborhood, so neighborhood
+# questions resolve straight to the district councilor. West Roxbury comes
+# before Roxbury so the substring scan matches the longer name first.
+NEIGHBORHOOD_TO_DISTRICT = {
+    'charlestown': '1',
+    'east boston': '1',
+    'north end': '1',
+    'south end': '2',
+    'dorchester': '3',
+    'roslindale': '5',
+    'hyde park': '5',
+    'jamaica plain': '6',
+    'west roxbury': '6',
+    'roxbury': '7',
+    'back bay': '8',
+    'mission hill': '8',
+    'allston': '9',
+    'brighton': '9'
+}
+
 OFFICE_VARIATIONS = {
     'mayor': ['mayor', 'mayer', 'major'],
     'city councilor': ['city councilor', 'city councilman', 'councilor', 'councilman', 'council member'],
@@ -421,222 +481,378 @@ OFFICE_VARIATIONS = {
     'state representative': ['state representative', 'state rep', 'representative', 'rep']
 }
 
+# Every known variation mapped to its standard neighborhood or office name
+VARIATION_TO_STANDARD = {
+    variation: standard
+    for variations_map in (NEIGHBORHOOD_VARIATIONS, OFFICE_VARIATIONS)
+    for standard, variations in variations_map.items()
+    for variation in variations
+}
+VARIATION_KEYS = list(VARIATION_TO_STANDARD)
+# fuzz.ratio can reach at most 2*shorter/(len1+len2), so a term longer than 1.5x
+# the longest variation can never score 80 against any of them
+MAX_FUZZY_TERM_LENGTH = max(len(key) for key in VARIATION_KEYS) * 3 // 2
+
+@lru_cache(maxsize=4096)
 def normalize_search_term(search_term: str) -> str:
     """Normalize search term by checking for common variations and misspellings."""
     search_lower = search_term.lower().strip()
     
-    for standard_name, variations in NEIGHBORHOOD_VARIATIONS.items():
-        for variation in variations:
-            if fuzzy_match(search_lower, variation, 0.8):
-                return standard_name
+    if search_lower in VARIATION_TO_STANDARD:
+        return VARIATION_TO_STANDARD[search_lower]
+    
+    if len(search_lower) > MAX_FUZZY_TERM_LENGTH:
+        return search_term
     
-    for standard_office, variations in OFFICE_VARIATIONS.items():
-        for variation in variations:
-            if fuzzy_match(search_lower, variation, 0.8):
-                return standard_office
+    match = process.extractOne(search_lower, VARIATION_KEYS, scorer=fuzz.ratio, score_cutoff=80)
+    if match:
+        return VARIATION_TO_STANDARD[match[0]]
     
     return search_term
 
-async def search_officials(query: str, intent_analysis: dict) -> List[Dict]:
-    """Database search logic with enhanced debugging."""
-    try:
-        async with aiosqlite.connect(DATABASE_URL) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.cursor()
-            
-            query_lower = query.lower().strip()
-            print(f"SEARCH DEBUG: Searching database for: '{query}' (normalized: '{query_lower}')")
-            
-            # PARTY-BASED SEARCHES
-            party_mappings = {
-                'democrat': ['democrat', 'democratic', 'dem', 'blue'],
-                'republican': ['republican', 'gop', 'red'],
-                'nonpartisan': ['nonpartisan', 'non-partisan', 'independent']
-            }
-            
-            for party, keywords in party_mappings.items():
-                if any(word in query_lower for word in keywords):
-                    print(f"SEARCH DEBUG: Party search - {party.capitalize()}")
-                    sql_query = f"""
-                        SELECT * FROM officials 
-                        WHERE LOWER(party) LIKE '%{party}%'
-                        ORDER BY office, name
-                    """
-                    await cursor.execute(sql_query)
-                    results = await cursor.fetchall()
-                    await cursor.close()
-                    print(f"SEARCH DEBUG: Found {len(results)} {party} officials")
-                    if party == 'republican' and not results:
-                        return [{"special_message": "no_republicans"}]
-                    return [dict(row) for row in results]
-            
-            # DISTRICT SEARCHES
-            district_match = re.search(r'district\s+(\d+)', query_lower)
-            if district_match:
-                district_num = district_match.group(1)
-                print(f"SEARCH DEBUG: District search for district {district_num}")
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE district_type = 'District' AND district_number = ?
-                """
-                await cursor.execute(sql_query, (district_num,))
-                results = await cursor.fetchall()
-                await cursor.close()
-                print(f"SEARCH DEBUG: Found {len(results)} officials in district {district_num}")
-                return [dict(row) for row in results]
-            
-            # OFFICE SEARCHES with intent prioritization
-            normalized_query = normalize_search_term(query)
-            search_pattern = f"%{normalized_query}%"
-            
-            print(f"SEARCH DEBUG: Office search with pattern: '{search_pattern}'")
-            if "time_in_office" in intent_analysis["target_info"] and normalized_query in ["governor", "mayor"]:
-                # Prioritize the primary office holder (e.g., Governor or Mayor) for time
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE LOWER(office) LIKE LOWER(?) AND name IN ('Maura Healey', 'Michelle Wu')
-                    LIMIT 1
-                """
-                await cursor.execute(sql_query, (search_pattern,))
-                results = await cursor.fetchall()
-                if results:
-                    print(f"SEARCH DEBUG: Time-in-office search found {len(results)} result")
-                    await cursor.close()
-                    return [dict(row) for row in results]
-            elif "contact" in intent_analysis["target_info"] and normalized_query in ["governor", "mayor"]:
-                # Prioritize the primary office holder (e.g., Governor or Mayor) for contact
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE LOWER(office) LIKE LOWER(?) AND name IN ('Maura Healey', 'Michelle Wu')
-                    LIMIT 1
-                """
-                await cursor.execute(sql_query, (search_pattern,))
-                results = await cursor.fetchall()
-                if results:
-                    print(f"SEARCH DEBUG: Contact search found {len(results)} result")
-                    await cursor.close()
-                    return [dict(row) for row in results]
-            elif "party" in intent_analysis["target_info"] and normalized_query == "senator":
-                # Prioritize Elizabeth Warren for party
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE LOWER(office) LIKE ? AND level = 'Federal' AND name = 'Elizabeth Warren'
-                    LIMIT 1
-                """
-                await cursor.execute(sql_query, ('%senator%',))
-                results = await cursor.fetchall()
-                print(f"SEARCH DEBUG: Party search found {len(results)} result")
-                if results:
-                    await cursor.close()
-                    return [dict(row) for row in results]
-            elif "education" in intent_analysis["target_info"]:
-                # Prioritize Elizabeth Warren for education with explicit office match
-                print(f"SEARCH DEBUG: Entering education intent block for normalized_query: '{normalized_query}'")
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE LOWER(office) IN ('senator', 'u.s. senator') AND level = 'Federal' AND name = 'Elizabeth Warren'
-                    LIMIT 1
-                """
-                await cursor.execute(sql_query)
-                results = await cursor.fetchall()
-                print(f"SEARCH DEBUG: Education search query executed, results: {results}")
-                if results:
-                    await cursor.close()
-                    return [dict(row) for row in results]
-            elif "policy" in intent_analysis["target_info"] and normalized_query == "mayor":
-                # Prioritize Michelle Wu for policy
-                sql_query = """
-                    SELECT * FROM officials 
-                    WHERE LOWER(office) LIKE ? AND name = 'Michelle Wu'
-                    LIMIT 1
-                """
-                await cursor.execute(sql_query, ('%mayor%',))
-                results = await cursor.fetchall()
-                print(f"SEARCH DEBUG: Policy search found {len(results)} result")
-                if results:
-                    await cursor.close()
-                    return [dict(row) for row in results]
-            
-            sql_query = """
-                SELECT * FROM officials 
-                WHERE LOWER(office) LIKE LOWER(?)
-            """
-            if "salary" in intent_analysis["target_info"]:
-                sql_query += " AND annual_salary IS NOT NULL"
-            await cursor.execute(sql_query, (search_pattern,))
-            results = await cursor.fetchall()
-            
-            print(f"SEARCH DEBUG: Office search found {len(results)} results")
-            for result in results:
-                print(f"SEARCH DEBUG: - {result['name']} ({result['office']})")
-            
-            if results:
-                await cursor.close()
-                return [dict(row) for row in results]
-            
-            # NAME-BASED SEARCHES
-            print(f"SEARCH DEBUG: Trying name search with pattern: '{search_pattern}'")
-            sql_query = """
-                SELECT * FROM officials 
-                WHERE LOWER(name) LIKE LOWER(?)
-            """
-            if "salary" in intent_analysis["target_info"]:
-                sql_query += " AND annual_salary IS NOT NULL"
-            await cursor.execute(sql_query, (search_pattern,))
-            results = await cursor.fetchall()
-            
-            print(f"SEARCH DEBUG: Name search found {len(results)} results")
-            
+# Every neighborhood spelling as one word-bounded alternation, longest first so
+# "east boston" and "west roxbury" win over anything they contain
+NEIGHBORHOOD_PATTERN = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(variation)
+        for variation in sorted(
+            (variation for variations in NEIGHBORHOOD_VARIATIONS.values() for variation in variations),
+            key=len, reverse=True
+        )
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+def neighborhood_district(search_term: str) -> Optional[str]:
+    """Return the city council district for a neighborhood search, if any."""
+    match = NEIGHBORHOOD_PATTERN.search(search_term)
+    standard = VARIATION_TO_STANDARD[match.group(1).lower()] if match else normalize_search_term(search_term)
+    return NEIGHBORHOOD_TO_DISTRICT.get(standard)
+
+# Office words that ask for someone other than the district councilor
+NON_COUNCIL_OFFICE_TERMS = tuple(key for key, office in SEARCH_OFFICE_TERMS.items() if office != 'councilor')
+
+def resolve_neighborhoods(query: str) -> str:
+    """Rewrite neighborhood mentions in a query to their city council district ("council district N")."""
+    query_lower = query.lower()
+    if any(term in query_lower for term in NON_COUNCIL_OFFICE_TERMS):
+        return query
+    return NEIGHBORHOOD_PATTERN.sub(
+        lambda match: f"council district {NEIGHBORHOOD_TO_DISTRICT[VARIATION_TO_STANDARD[match.group(1).lower()]]}",
+        query
+    )
+
+# OFFICIALS SNAPSHOT
+# Every column the response generator reads (everything except the rowid key)
+OFFICIAL_COLUMNS = """
+    name, office, district_type, district_number, district_area,
+    email, phone, website, x_account, facebook_page, level, party,
+    term_start_date, next_election_date, annual_salary,
+    bio_summary, education, career_before_office, key_policy_areas,
+    committee_memberships, recent_major_vote, recent_initiative,
+    campaign_promises, responsiveness_score, town_halls_per_year, office_hours
+"""
+
+# Text fields searched case-insensitively (stored lowercased as "<field>_lower")
+SEARCH_FIELDS = ('name', 'office', 'level', 'party')
+
+# Standard office terms most searches normalize to; their office matches are prebuilt
+COMMON_OFFICE_TERMS = ('mayor', 'governor', 'city councilor', 'state senator', 'state representative')
+
+# Party searched for when a query mentions any of its keywords (checked in order)
+PARTY_KEYWORDS = {
+    'democrat': ['democrat', 'democratic', 'dem', 'blue'],
+    'republican': ['republican', 'gop', 'red'],
+    'nonpartisan': ['nonpartisan', 'non-partisan', 'independent']
+}
+
+# Officials preferred when a time-in-office or contact question names their office
+PRIMARY_OFFICE_HOLDERS = ('Maura Healey', 'Michelle Wu')
+
+# Single-official answers preferred for some intents, checked in order; the first rule
+# whose intent and search term match is tried. Each rule is
+# (target info, search terms or None for any, exact offices or None to match the term, level or None, names)
+PRIORITY_RULES = (
+    ("time_in_office", ("governor", "mayor"), None, None, PRIMARY_OFFICE_HOLDERS),
+    ("contact", ("governor", "mayor"), None, None, PRIMARY_OFFICE_HOLDERS),
+    ("party", ("senator",), None, "Federal", ("Elizabeth Warren",)),
+    ("education", None, ("senator", "u.s. senator"), "Federal", ("Elizabeth Warren",)),
+    ("policy", ("mayor",), None, None, ("Michelle Wu",)),
+)
+
+async def load_officials():
+    """Load the officials table into memory, lowercased for search and indexed for the common lookups."""
+    global officials_data, officials_by_district, officials_by_office, officials_by_party
+    async with aiosqlite.connect(DATABASE_URL) as db:
+        db.row_factory = aiosqlite.Row
+        rows = await db.execute_fetchall(f"SELECT {OFFICIAL_COLUMNS} FROM officials ORDER BY id")
+    
+    officials_data = [dict(row) for row in rows]
+    officials_by_district = {}
+    for official in officials_data:
+        # Lowercased copies of the searched fields, so searches never re-lowercase them
+        for field in SEARCH_FIELDS:
+            official[f"{field}_lower"] = (official[field] or '').lower()
+        # Profile text is stripped once here, so formatting only checks truthiness
+        for field, _ in DETAILED_PROFILE_FIELDS:
+            official[field] = (official[field] or '').strip()
+        if official['district_type'] == 'District':
+            district = parse_int(official['district_number'])
+            if district is not None:
+                officials_by_district.setdefault(district, []).append(official)
+    officials_by_office = {
+        term: [official for official in officials_data if term in official['office_lower']]
+        for term in COMMON_OFFICE_TERMS
+    }
+    officials_by_party = {
+        party: sorted(
+            (official for official in officials_data if party in official['party_lower']),
+            key=lambda official: (official['office'], official['name'])
+        )
+        for party in PARTY_KEYWORDS
+    }
+    
+    search_cache.clear()
+    response_cache.clear()
+    logger.info("Loaded %s officials into memory", len(officials_data))
+
+def district_councilors(district_num: int) -> List[Dict]:
+    """City councilors for a council district (other officials share district numbers)."""
+    results = [
+        official for official in officials_by_district.get(district_num, [])
+        if official['office'] == 'City Councilor'
+    ]
+    logger.debug("Found %s councilors in district %s", len(results), district_num)
+    return results
+
+def query_officials(query: str, intent_analysis: Mapping) -> List[Dict]:
+    """In-memory search logic with enhanced debugging."""
+    query_lower = query.lower().strip()
+    logger.debug("Searching officials for: '%s' (normalized: '%s')", query, query_lower)
+    
+    # PARTY-BASED SEARCHES
+    for party, keywords in PARTY_KEYWORDS.items():
+        if any(word in query_lower for word in keywords):
+            logger.debug("Party search - %s", party.capitalize())
+            results = officials_by_party[party]
+            logger.debug("Found %s %s officials", len(results), party)
+            if party == 'republican' and not results:
+                return [{"special_message": "no_republicans"}]
+            return results
+    
+    # COUNCIL DISTRICT SEARCHES (from neighborhood mentions)
+    council_match = COUNCIL_DISTRICT_PATTERN.search(query)
+    if council_match:
+        district_num = int(council_match.group(1))
+        logger.debug("Council district search for district %s", district_num)
+        return district_councilors(district_num)
+    
+    # DISTRICT SEARCHES
+    district_match = DISTRICT_PATTERN.search(query)
+    if district_match:
+        district_num = int(district_match.group(1))
+        logger.debug("District search for district %s", district_num)
+        results = officials_by_district.get(district_num, [])
+        logger.debug("Found %s officials in district %s", len(results), district_num)
+        return results
+    
+    # NEIGHBORHOOD SEARCHES
+    district_num = neighborhood_district(query)
+    if district_num:
+        logger.debug("Neighborhood search for council district %s", district_num)
+        return district_councilors(int(district_num))
+    
+    # OFFICE SEARCHES with intent prioritization
+    normalized_query = normalize_search_term(query)
+    search_text = normalized_query.lower()
+    
+    logger.debug("Office search for: '%s'", search_text)
+    for target, terms, offices, level, names in PRIORITY_RULES:
+        if target in intent_analysis["target_info"] and (terms is None or normalized_query in terms):
+            results = [
+                official for official in officials_data
+                if (official['office_lower'] in offices if offices else search_text in official['office_lower'])
+                and (level is None or official['level'] == level)
+                and official['name'] in names
+            ][:1]
+            logger.debug("Prioritized %s search found %s result", target, len(results))
             if results:
-                await cursor.close()
-                return [dict(row) for row in results]
-            
-            # GENERAL SEARCH (fallback)
-            print(f"SEARCH DEBUG: Trying general search with pattern: '{search_pattern}'")
-            sql_query = """
-                SELECT * FROM officials 
-                WHERE LOWER(name) LIKE LOWER(?) 
-                OR LOWER(office) LIKE LOWER(?)
-                OR LOWER(level) LIKE LOWER(?)
-            """
-            if "salary" in intent_analysis["target_info"]:
-                sql_query += " AND annual_salary IS NOT NULL"
-            await cursor.execute(sql_query, (search_pattern, search_pattern, search_pattern))
-            results = await cursor.fetchall()
-            await cursor.close()
-            
-            print(f"SEARCH DEBUG: General search found {len(results)} results")
-            return [dict(row) for row in results]
-    except Exception as e:
-        print(f"SEARCH DEBUG: Error in search_officials: {str(e)}")
+                return results
+            break
+    
+    salary_only = "salary" in intent_analysis["target_info"]
+    candidates = [
+        official for official in officials_data
+        if not salary_only or official['annual_salary'] is not None
+    ]
+    if search_text in officials_by_office and not salary_only:
+        results = officials_by_office[search_text]
+    else:
+        results = [official for official in candidates if search_text in official['office_lower']]
+    
+    logger.debug("Office search found %s results", len(results))
+    for result in results:
+        logger.debug("- %s (%s)", result['name'], result['office'])
+    
+    if results:
+        return results
+    
+    # NAME-BASED SEARCHES
+    logger.debug("Trying name search for: '%s'", search_text)
+    results = [official for official in candidates if search_text in official['name_lower']]
+    
+    logger.debug("Name search found %s results", len(results))
+    
+    if results:
+        return results
+    
+    # GENERAL SEARCH (fallback) - the salary filter only narrows level matches
+    logger.debug("Trying general search for: '%s'", search_text)
+    results = [
+        official for official in officials_data
+        if search_text in official['name_lower']
+        or search_text in official['office_lower']
+        or (search_text in official['level_lower'] and (not salary_only or official['annual_salary'] is not None))
+    ]
+    
+    logger.debug("General search found %s results", len(results))
+    return results
+
+def search_officials(query: str, intent_analysis: Mapping) -> List[Dict]:
+    """Search officials, reusing recent results for the same search term and intent."""
+    cache_key = (query.lower(), intent_analysis["target_info"])
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        search_cache.move_to_end(cache_key)
+        return cached
+    
+    try:
+        results = query_officials(query, intent_analysis)
+    except Exception:
+        logger.exception("Error in search_officials")
         return []
+    
+    search_cache[cache_key] = results
+    if len(search_cache) > SEARCH_CACHE_SIZE:
+        search_cache.popitem(last=False)
+    return results
 
 # RESPONSE GENERATOR
+# Profile fields listed in a detailed bio, in display order
+DETAILED_PROFILE_FIELDS = (
+    ('bio_summary', 'Bio'),
+    ('education', 'Education'),
+    ('career_before_office', 'Prior Career'),
+    ('key_policy_areas', 'Policy Focus'),
+    ('committee_memberships', 'Committees'),
+    ('recent_major_vote', 'Recent Vote'),
+    ('recent_initiative', 'Recent Initiative'),
+    ('campaign_promises', 'Campaign Promises'),
+    ('office_hours', 'Office Hours')
+)
+
+# Contact channels listed in a contact response, in display order
+CONTACT_FIELDS = (
+    ('email', '📧 Email'),
+    ('phone', '📞 Phone'),
+    ('website', '🌐 Website'),
+    ('x_account', '𝕏 Account'),
+    ('facebook_page', 'Facebook')
+)
+
 class ResponseGenerator:
     """Generates contextually appropriate responses using rich biographical data."""
     
     @staticmethod
     def calculate_time_in_office(start_date_str: str) -> str:
         """Calculate how long someone has been in office."""
+        return ResponseGenerator._time_in_office(start_date_str, date.today())
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _time_in_office(start_date_str: str, today: date) -> str:
+        """Duration between a start date and today (cached per day, so it rolls over at midnight)."""
+        if not start_date_str:
+            return "unknown duration"
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            current_date = datetime.now()
-            difference = current_date - start_date
-            
-            years = difference.days // 365
-            months = (difference.days % 365) // 30
-            
-            if years > 0:
-                return f"{years} year{'s' if years != 1 else ''} and {months} month{'s' if months != 1 else ''}"
-            elif months > 0:
-                return f"{months} month{'s' if months != 1 else ''}"
-            else:
-                return f"{difference.days} day{'s' if difference.days != 1 else ''}"
-        except:
+            start_date = date.fromisoformat(start_date_str)
+        except ValueError:
             return "unknown duration"
+        difference = today - start_date
+        
+        years = difference.days // 365
+        months = (difference.days % 365) // 30
+        
+        if years > 0:
+            return f"{years} year{'s' if years != 1 else ''} and {months} month{'s' if months != 1 else ''}"
+        elif months > 0:
+            return f"{months} month{'s' if months != 1 else ''}"
+        else:
+            return f"{difference.days} day{'s' if difference.days != 1 else ''}"
+    
+    @staticmethod
+    def format_official_line(official: Dict) -> str:
+        """Format one official as a bullet line for multi-official listings."""
+        if official.get('district_type') and official.get('district_number'):
+            district = f" ({official['district_type']} {official['district_number']})"
+        elif official.get('district_area'):
+            district = f" ({official['district_area']})"
+        else:
+            district = ""
+        return f"- **{official['name']}**, {official['office']}{district}"
+    
+    @staticmethod
+    def education_response(official: Dict) -> str:
+        """Answer where an official went to school."""
+        if official['education']:
+            return f"**{official['name']}** graduated from **{official['education']}**."
+        return f"I don't have educational background information for **{official['name']}**."
+    
+    @staticmethod
+    def career_response(official: Dict) -> str:
+        """Answer what an official did before taking office."""
+        if official['career_before_office']:
+            return f"**Before entering office, {official['name']}** worked as: {official['career_before_office']}."
+        return f"I don't have career background information for **{official['name']}**."
+    
+    @staticmethod
+    def policy_response(official: Dict) -> str:
+        """Answer what an official focuses on."""
+        if official['key_policy_areas']:
+            return f"**{official['name']}** focuses on: **{official['key_policy_areas']}**."
+        return f"I don't have policy focus information for **{official['name']}**."
+    
+    @staticmethod
+    def salary_response(official: Dict) -> str:
+        """Answer what an official earns."""
+        if official.get('annual_salary'):
+            return f"**{official['name']}** earns **${official['annual_salary']:,}** per year as {official['office']}."
+        return f"I don't have salary information for **{official['name']}**."
+    
+    @staticmethod
+    def time_in_office_response(official: Dict) -> str:
+        """Answer how long an official has held office."""
+        if official.get('term_start_date'):
+            duration = ResponseGenerator.calculate_time_in_office(official['term_start_date'])
+            return f"**{official['name']}** has been {official['office']} since **{official['term_start_date']}** ({duration})."
+        return f"I don't have the start date information for **{official['name']}**."
     
     @staticmethod
-    def generate_response(officials: List[Dict], intent_analysis: dict, original_query: str) -> str:
+    def contact_response(official: Dict) -> str:
+        """List every contact channel for an official."""
+        lines = [f"**Contact {official['name']}**"]
+        lines.extend(f"{label}: {official[field] or 'N/A'}" for field, label in CONTACT_FIELDS)
+        return "\n".join(lines)
+    
+    @staticmethod
+    def party_response(official: Dict) -> str:
+        """Answer which party an official belongs to."""
+        if official.get('party'):
+            return f"**{official['name']}** is affiliated with the **{official['party']}** party."
+        return f"I don't have party affiliation information for **{official['name']}**."
+    
+    @staticmethod
+    def generate_response(officials: List[Dict], intent_analysis: Mapping, original_query: str) -> str:
         """Generate intelligent, contextually appropriate responses using enhanced biographical data."""
         if not officials:
             return f"I couldn't find any officials matching '{original_query}'. Try searching by name, office, or party."
@@ -653,95 +869,36 @@ At the state and federal level representing Boston, officials are predominantly
         if len(officials) == 1:
             official = officials[0]
             
-            # EDUCATION-FOCUSED RESPONSES
-            if "education" in intent_analysis["target_info"]:
-                if official.get('education') and official['education'].strip():
-                    return f"**{official['name']}** graduated from **{official['education']}**."
-                else:
-                    return f"I don't have educational background information for **{official['name']}**."
-            
-            # CAREER/BACKGROUND-FOCUSED RESPONSES
-            if "career" in intent_analysis["target_info"]:
-                if official.get('career_before_office') and official['career_before_office'].strip():
-                    return f"**Before entering office, {official['name']}** worked as: {official['career_before_office']}."
-                else:
-                    return f"I don't have career background information for **{official['name']}**."
-            
-            # POLICY/FOCUS-FOCUSED RESPONSES
-            if "policy" in intent_analysis["target_info"]:
-                if official.get('key_policy_areas') and official['key_policy_areas'].strip():
-                    return f"**{official['name']}** focuses on: **{official['key_policy_areas']}**."
-                else:
-                    return f"I don't have policy focus information for **{official['name']}**."
-            
-            # SALARY-FOCUSED RESPONSES
-            if "salary" in intent_analysis["target_info"]:
-                if official.get('annual_salary'):
-                    return f"**{official['name']}** earns **${official['annual_salary']:,}** per year as {official['office']}."
-                else:
-                    return f"I don't have salary information for **{official['name']}**."
-            
-            # TIME-IN-OFFICE RESPONSES
-            if "time_in_office" in intent_analysis["target_info"]:
-                if official.get('term_start_date'):
-                    duration = ResponseGenerator.calculate_time_in_office(official['term_start_date'])
-                    return f"**{official['name']}** has been {official['office']} since **{official['term_start_date']}** ({duration})."
-                else:
-                    return f"I don't have the start date information for **{official['name']}**."
-            
-            # CONTACT-FOCUSED RESPONSES
-            if "contact" in intent_analysis["target_info"]:
-                contact_info = f"**Contact {official['name']}**\n"
-                contact_info += f"📧 Email: {official['email'] or 'N/A'}\n"
-                contact_info += f"📞 Phone: {official['phone'] or 'N/A'}\n"
-                contact_info += f"🌐 Website: {official['website'] or 'N/A'}\n"
-                contact_info += f"𝕏 Account: {official['x_account'] or 'N/A'}\n"
-                contact_info += f"Facebook: {official['facebook_page'] or 'N/A'}"
-                return contact_info
-            
-            # PARTY-FOCUSED RESPONSES
-            if "party" in intent_analysis["target_info"]:
-                if official.get('party'):
-                    return f"**{official['name']}** is affiliated with the **{official['party']}** party."
-                else:
-                    return f"I don't have party affiliation information for **{official['name']}**."
+            # Responses focused on one piece of information, in priority order
+            for target, respond in TARGET_RESPONSES:
+                if target in intent_analysis["target_info"]:
+                    return respond(official)
             
             # DETAILED BIO RESPONSE
             if intent_analysis["detail_level"] == "detailed":
-                response = f"**{official['name']}** - {official['office']}\n\n"
-                fields = [
-                    ('bio_summary', 'Bio'),
-                    ('education', 'Education'),
-                    ('career_before_office', 'Prior Career'),
-                    ('key_policy_areas', 'Policy Focus'),
-                    ('committee_memberships', 'Committees'),
-                    ('recent_major_vote', 'Recent Vote'),
-                    ('recent_initiative', 'Recent Initiative'),
-                    ('campaign_promises', 'Campaign Promises'),
-                    ('office_hours', 'Office Hours')
-                ]
+                lines = [f"**{official['name']}** - {official['office']}", ""]
                 
-                for field, label in fields:
-                    if official.get(field) and official[field].strip():
-                        response += f"**{label}**: {official[field]}\n"
+                for field, label in DETAILED_PROFILE_FIELDS:
+                    if official[field]:
+                        lines.append(f"**{label}**: {official[field]}")
                 
                 if official.get('term_start_date'):
                     duration = ResponseGenerator.calculate_time_in_office(official['term_start_date'])
-                    response += f"**Time in Office**: Since {official['term_start_date']} ({duration})\n"
+                    lines.append(f"**Time in Office**: Since {official['term_start_date']} ({duration})")
                 
                 if official.get('next_election_date'):
-                    response += f"**Next Election**: {official['next_election_date']}\n"
+                    lines.append(f"**Next Election**: {official['next_election_date']}")
                 
                 if official.get('annual_salary'):
-                    response += f"**Salary**: ${official['annual_salary']:,} per year\n"
+                    lines.append(f"**Salary**: ${official['annual_salary']:,} per year")
                 
                 if official.get('responsiveness_score'):
-                    response += f"**Responsiveness Score**: {official['responsiveness_score']}/100\n"
+                    lines.append(f"**Responsiveness Score**: {official['responsiveness_score']}/100")
                 
                 if official.get('town_halls_per_year'):
-                    response += f"**Town Halls**: {official['town_halls_per_year']} per year\n"
+                    lines.append(f"**Town Halls**: {official['town_halls_per_year']} per year")
                 
-                return response.strip()
+                return "\n".join(lines).strip()
             
             # BASIC RESPONSE (default for single official)
             response = f"**{official['name']}** is the {official['office']} of "
@@ -757,25 +914,75 @@ At the state and federal level representing Boston, officials are predominantly
             return response
         
         # MULTIPLE OFFICIALS RESPONSE
-        response = "**Found multiple officials matching your query**:\n\n"
-        for official in officials:
-            response += f"- **{official['name']}**, {official['office']}"
-            if official.get('district_type') and official.get('district_number'):
-                response += f" ({official['district_type']} {official['district_number']})"
-            elif official.get('district_area'):
-                response += f" ({official['district_area']})"
-            response += "\n"
-        return response.strip()
+        lines = "\n".join(ResponseGenerator.format_official_line(official) for official in officials)
+        return f"**Found multiple officials matching your query**:\n\n{lines}".strip()
+
+# Single-official answers for a specific target, checked in this order
+TARGET_RESPONSES = (
+    ("education", ResponseGenerator.education_response),
+    ("career", ResponseGenerator.career_response),
+    ("policy", ResponseGenerator.policy_response),
+    ("salary", ResponseGenerator.salary_response),
+    ("time_in_office", ResponseGenerator.time_in_office_response),
+    ("contact", ResponseGenerator.contact_response),
+    ("party", ResponseGenerator.party_response),
+)
+
+# INDEX PAGE
+# Read and gzipped once at startup and served from memory; the ETag lets
+# returning browsers revalidate with a 304 instead of downloading the page again.
+INDEX_HTML_PATH = "index.html"
+INDEX_CACHE_CONTROL = "public, max-age=3600"
+index_html: Optional[bytes] = None
+index_html_gzip: Optional[bytes] = None
+index_etag: Optional[str] = None
+
+def load_index_html():
+    """Load the HTML interface into memory, precompress it and compute its ETag."""
+    global index_html, index_html_gzip, index_etag
+    try:
+        with open(INDEX_HTML_PATH, "rb") as f:
+            index_html = f.read()
+    except FileNotFoundError:
+        logger.warning("%s not found", INDEX_HTML_PATH)
+        index_html = index_html_gzip = index_etag = None
+        return
+    index_html_gzip = gzip.compress(index_html, compresslevel=9, mtime=0)
+    index_etag = f'"{hashlib.md5(index_html).hexdigest()}"'
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 means refused; "*" covers unlisted codings)."""
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
 
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
+    load_index_html()
     try:
         await init_database()
-    except Exception as e:
-        print(f"Failed to initialize database: {str(e)}")
+        await load_officials()
+    except Exception:
+        logger.exception("Failed to initialize database")
         raise HTTPException(status_code=500, detail="Failed to initialize database")
 
+# RESPONSE CACHE
+# Keyed by (query, enhanced query, day): the enhanced query already carries the
+# session context, and the day keeps "time in office" durations current.
+RESPONSE_CACHE_SIZE = 1024
+response_cache = OrderedDict()
+
 # API ENDPOINTS
 @app.post("/ask/")
 async def ask(request: QueryRequest):
@@ -787,39 +994,56 @@ async def search(query: str, session_id: str = "default"):
     """Main search endpoint - handles both GET and POST requests."""
     try:
         session = conversation_engine.get_session(session_id)
-        enhanced_query = conversation_engine.enhance_query_with_context(query, session)
+        enhanced_query = resolve_neighborhoods(conversation_engine.enhance_query_with_context(query, session))
+
+        cache_key = (query, enhanced_query, date.today())
+        response = response_cache.get(cache_key)
+        if response is not None:
+            response_cache.move_to_end(cache_key)
+            logger.debug("Response cache hit: %s", enhanced_query)
+        else:
+            # Analyze query intent
+            intent_analysis = QueryAnalyzer.analyze_query_intent(enhanced_query)
 
-        # Analyze query intent
-        intent_analysis = QueryAnalyzer.analyze_query_intent(enhanced_query)
-        entities = conversation_engine.extract_entities(enhanced_query)
+            # 🔍 DEBUG LOGGING (entities are only extracted when they will be logged)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Enhanced Query: %s", enhanced_query)
+                logger.debug("Intent Analysis: %s", intent_analysis)
+                logger.debug("Entities: %s", conversation_engine.extract_entities(enhanced_query))
 
-        # 🔍 DEBUG LOGGING
-        print("Enhanced Query:", enhanced_query)
-        print("Intent Analysis:", intent_analysis)
-        print("Entities:", entities)
+            # Extract search terms
+            search_term = extract_search_terms(enhanced_query)
 
-        # Extract search terms
-        search_term = extract_search_terms(enhanced_query)
+            # Search database
+            officials = search_officials(search_term, intent_analysis)
 
-        # Search database
-        officials = await search_officials(search_term, intent_analysis)
+            # Generate response
+            response = ResponseGenerator.generate_response(officials, intent_analysis, query)
 
-        # Generate response
-        response = ResponseGenerator.generate_response(officials, intent_analysis, query)
+            response_cache[cache_key] = response
+            if len(response_cache) > RESPONSE_CACHE_SIZE:
+                response_cache.popitem(last=False)
 
         # Store conversation exchange
         conversation_engine.add_exchange(session_id, query, response)
 
         return {"response": response}
-    except Exception as e:
-        print(f"Error in search endpoint: {str(e)}")
+    except Exception:
+        logger.exception("Error in search endpoint")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/", response_class=HTMLResponse)
-async def serve_html():
+async def serve_html(request: Request):
     """Serve the HTML interface."""
-    try:
-        with open("index.html", "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="HTML file not found")
\ No newline at end of file
+    if index_html is None:
+        raise HTTPException(status_code=404, detail="HTML file not found")
+    
+    use_gzip = accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = f'{index_etag[:-1]}-gzip"' if use_gzip else index_etag
+    headers = {"ETag": etag, "Cache-Control": INDEX_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=index_html_gzip, headers=headers)
+    return HTMLResponse(content=index_html, headers=headers)
\ No newline at end of file
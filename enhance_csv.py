@@ -6,6 +6,7 @@ Adds new columns to officials.csv without modifying existing data
 
 import csv
 import os
+import shutil
 from datetime import datetime
 
 def enhance_officials_csv():
@@ -41,9 +42,7 @@ def enhance_officials_csv():
         
         # Create backup of original file
         print(f"📋 Creating backup: {backup_file}")
-        with open(input_file, 'r', encoding='utf-8') as src:
-            with open(backup_file, 'w', encoding='utf-8') as dst:
-                dst.write(src.read())
+        shutil.copyfile(input_file, backup_file)
         
         # Read existing CSV
         print(f"📖 Reading existing data from {input_file}")
@@ -60,15 +59,10 @@ def enhance_officials_csv():
         # Write enhanced CSV
         print(f"✍️  Writing enhanced data to {output_file}")
         with open(output_file, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=enhanced_fieldnames)
+            # New columns are missing from every row, so restval fills them with empty placeholders
+            writer = csv.DictWriter(file, fieldnames=enhanced_fieldnames, restval='')
             writer.writeheader()
-            
-            for row in existing_data:
-                # Add empty values for new columns
-                for col in new_columns:
-                    row[col] = ''  # Empty string as placeholder
-                
-                writer.writerow(row)
+            writer.writerows(existing_data)
         
         print("🎉 SUCCESS! Enhanced CSV created.")
         print(f"\n📊 Summary:")
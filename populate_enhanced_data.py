@@ -6,6 +6,7 @@ Adds bio_summary, education, career_before_office, key_policy_areas for all 46 o
 
 import csv
 import os
+import shutil
 from datetime import datetime
 
 # Enhanced data for all officials (researched from reliable sources)
@@ -288,6 +289,9 @@ ENHANCED_DATA = {
     }
 }
 
+# ENHANCED_DATA keyed by casefolded name, so CSV names differing in case or padding still match
+ENHANCED_DATA_BY_KEY = {name.casefold(): enhanced for name, enhanced in ENHANCED_DATA.items()}
+
 def update_officials_csv():
     """Update the officials CSV with enhanced data."""
     
@@ -301,9 +305,7 @@ def update_officials_csv():
     
     # Create backup
     print(f"📋 Creating backup: {backup_file}")
-    with open(input_file, 'r', encoding='utf-8') as src:
-        with open(backup_file, 'w', encoding='utf-8') as dst:
-            dst.write(src.read())
+    shutil.copyfile(input_file, backup_file)
     
     # Read existing data
     print(f"📖 Reading data from {input_file}")
@@ -313,17 +315,16 @@ def update_officials_csv():
         fieldnames = reader.fieldnames
     
     # Update officials with enhanced data
-    updated_count = 0
+    updated_names = []
     for official in officials_data:
         name = official['name']
-        if name in ENHANCED_DATA:
-            enhanced = ENHANCED_DATA[name]
-            official['bio_summary'] = enhanced['bio_summary']
-            official['education'] = enhanced['education']
-            official['career_before_office'] = enhanced['career_before_office']
-            official['key_policy_areas'] = enhanced['key_policy_areas']
-            updated_count += 1
-            print(f"✅ Enhanced data added for {name}")
+        enhanced = ENHANCED_DATA_BY_KEY.get(name.strip().casefold())
+        if enhanced:
+            # Every entry carries exactly the four enhanced fields
+            official.update(enhanced)
+            updated_names.append(name)
+    if updated_names:
+        print(f"✅ Enhanced data added for {', '.join(updated_names)}")
     
     # Write updated CSV
     print(f"✍️  Writing enhanced data to {output_file}")
@@ -334,7 +335,7 @@ def update_officials_csv():
     
     print(f"\n🎉 SUCCESS! Enhanced data populated.")
     print(f"📊 Summary:")
-    print(f"   • Officials enhanced: {updated_count}/{len(officials_data)}")
+    print(f"   • Officials enhanced: {len(updated_names)}/{len(officials_data)}")
     print(f"   • Fields added: bio_summary, education, career_before_office, key_policy_areas")
     print(f"   • Output file: {output_file}")
     print(f"   • Backup created: {backup_file}")
@@ -1,22 +1,31 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
+
+# Capitalized words and runs of them (e.g. "Michelle Wu") treated as entities
+ENTITY_PATTERN = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*")
+
+# Keywords mapped to the information they ask for, checked in order
+INTENT_KEYWORDS = (
+    ("salary", "salary"),
+    ("contact", "contact"),
+    ("education", "education"),
+    ("background", "career"),
+    ("career", "career"),
+)
 
 class QueryAnalyzer:
+    # Both results are cached per query string and shared, so they are immutable
     @staticmethod
-    def analyze_query_intent(query: str) -> dict:
-        intent = {}
+    @lru_cache(maxsize=1024)
+    def analyze_query_intent(query: str) -> MappingProxyType:
         query_lower = query.lower()
-        if "salary" in query_lower:
-            intent["target_info"] = "salary"
-        elif "contact" in query_lower:
-            intent["target_info"] = "contact"
-        elif "education" in query_lower:
-            intent["target_info"] = "education"
-        elif "background" in query_lower or "career" in query_lower:
-            intent["target_info"] = "career"
-        else:
-            intent["target_info"] = "general"
-        return intent
+        for keyword, target in INTENT_KEYWORDS:
+            if keyword in query_lower:
+                return MappingProxyType({"target_info": target})
+        return MappingProxyType({"target_info": "general"})
 
     @staticmethod
-    def extract_entities(query: str) -> list:
-        return re.findall(r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*", query)
+    @lru_cache(maxsize=1024)
+    def extract_entities(query: str) -> tuple:
+        return tuple(ENTITY_PATTERN.findall(query))
@@ -1,9 +1,64 @@
-from app import extract_search_terms, QueryAnalyzer
+import asyncio
+import time
 
-query = "how much does the mayor make"
+from app import (
+    extract_search_terms, init_database, load_officials, QueryAnalyzer,
+    response_cache, search, search_cache,
+)
 
-search_term = extract_search_terms(query)
-intent_analysis = QueryAnalyzer.analyze_query_intent(query)
+# Per-query cost of term extraction + intent analysis; the second pass hits the caches
+QUERIES = [
+    "how much does the mayor make",
+    "who is the governor",
+    "what is Michelle Wu's email",
+    "where did Elizabeth Warren go to school",
+    "who represents district 4",
+    "democrat officials",
+    "how long has the governor been in office",
+    "tell me about Ayanna Pressley",
+]
 
-print("Search term:", search_term)
-print("Intent analysis:", intent_analysis)
+# Neighborhood mentions resolve to that district's city councilor unless another office is named
+NEIGHBORHOOD_CHECKS = [
+    ("who represents roslindale", "**Enrique Pepén** is the City Councilor"),
+    ("allston councilor", "**Liz Breadon** is the City Councilor"),
+    ("south end councilor", "**Ed Flynn** is the City Councilor"),
+    ("east boston", "**Gabriela Coletta Zapata** is the City Councilor"),
+    ("who is the city councilor for west roxbury", "**Benjamin Weber** is the City Councilor"),
+    ("jp", "**Benjamin Weber** is the City Councilor"),
+    ("back bay", "**Sharon Durkan** is the City Councilor"),
+    ("mayor of charlestown", "**Michelle Wu** is the Mayor"),
+    ("who is the state senator for dorchester", "**Nick Collins**, State Senator"),
+]
+
+async def check_neighborhoods():
+    await init_database()
+    await load_officials()
+    for q, expected in NEIGHBORHOOD_CHECKS:
+        response = (await search(q, session_id=f"neighborhood check: {q}"))["response"]
+        assert expected in response, f"{q!r}: {response}"
+    print(f"Neighborhood checks passed ({len(NEIGHBORHOOD_CHECKS)} queries)")
+
+if __name__ == "__main__":
+    query = "how much does the mayor make"
+
+    search_term = extract_search_terms(query)
+    intent_analysis = QueryAnalyzer.analyze_query_intent(query)
+
+    print("Search term:", search_term)
+    print("Intent analysis:", intent_analysis)
+
+    # Start the cold pass with every cache empty
+    response_cache.clear()
+    search_cache.clear()
+    extract_search_terms.cache_clear()
+    QueryAnalyzer.analyze_query_intent.cache_clear()
+
+    for label in ("cold", "cached"):
+        start = time.perf_counter_ns()
+        for q in QUERIES:
+            extract_search_terms(q)
+            QueryAnalyzer.analyze_query_intent(q)
+        print(f"{label}: {(time.perf_counter_ns() - start) / len(QUERIES):,.0f} ns/query")
+
+    asyncio.run(check_neighborhoods())